@@ -610,6 +610,8 @@ def check_for_migrations(worker: bool = True):
 
     # We should be current now - triggering full reload to make sure all models
     # are loaded fully in their new state.
+    # Packages might have been installed since the last discovery - so rescan them.
+    registry.invalidate_plugin_cache()
     registry.reload_plugins(full_reload=True, force_reload=True)
 
 
@@ -1,6 +1,10 @@
 """Plugin mixin class for AppMixin."""
+import functools
+import inspect
 import logging
+import sys
 from importlib import reload
+from pathlib import Path
 
 from django.apps import apps
 from django.conf import settings
@@ -9,6 +13,33 @@ from django.contrib import admin
 logger = logging.getLogger('inventree')
 
 
+def get_plugin_class_path(plugin_cls, base_dir):
+    """Return the python dot-path of the app for a plugin class.
+
+    Args:
+        plugin_cls: Plugin class
+        base_dir: Base directory local plugins are resolved against
+    """
+    module_name = plugin_cls.__module__
+    return _get_plugin_module_path(inspect.getfile(sys.modules[module_name]), module_name, base_dir)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_plugin_module_path(module_file, module_name, base_dir):
+    """Resolve the app path of a plugin module.
+
+    Cached by module file and name - the path is resolved on every (re)load of the plugin apps and
+    reloading a plugin creates new class objects, which must not be kept alive by the cache. The file
+    is part of the key as a module can be reloaded under the same name from a different directory.
+    """
+    try:
+        # for local path plugins
+        return '.'.join(Path(module_file).parent.relative_to(base_dir).parts)
+    except ValueError:  # pragma: no cover
+        # plugin is shipped as package - extract plugin module name
+        return module_name.split('.')[0]
+
+
 class AppMixin:
     """Mixin that enables full django app functions for a plugin."""
 
@@ -28,7 +59,7 @@ class AppMixin:
 
         Args:
             registry (PluginRegistry): The registry that should be used
-            plugins (dict): List of IntegrationPlugins that should be installed
+            plugins (tuple): Key / plugin pairs of IntegrationPlugins that should be installed
             force_reload (bool, optional): Only reload base apps. Defaults to False.
             full_reload (bool, optional): Reload everything - including plugin mechanism. Defaults to False.
         """
@@ -36,21 +67,27 @@ class AppMixin:
 
         if settings.PLUGIN_TESTING or InvenTreeSetting.get_setting('ENABLE_PLUGINS_APP'):
             logger.info('Registering IntegrationPlugin apps')
-            apps_changed = False
+            installed_apps = set(settings.INSTALLED_APPS)
+            new_apps = []
 
-            # add them to the INSTALLED_APPS
+            # collect the apps that are not in INSTALLED_APPS yet
             for _key, plugin in plugins:
-                if plugin.mixin_enabled('app'):
+                if plugin.mixin_enabled_cached('app'):
                     plugin_path = cls._get_plugin_path(plugin)
-                    if plugin_path not in settings.INSTALLED_APPS:
-                        settings.INSTALLED_APPS += [plugin_path]
-                        registry.installed_apps += [plugin_path]
-                        apps_changed = True
+                    if plugin_path not in installed_apps:
+                        installed_apps.add(plugin_path)
+                        new_apps.append(plugin_path)
+
+            # add them to the INSTALLED_APPS
+            apps_changed = bool(new_apps)
+            if apps_changed:
+                settings.INSTALLED_APPS += new_apps
+                registry.installed_apps += new_apps
 
             # if apps were changed or force loading base apps -> reload
             # Ignore reloading if we are in testing mode and apps are unchanged so that tests run faster
             # registry.reload_plugins(...) first unloads and then loads the plugins
-            # always reload if we are not in testing mode so we can expect the second reload
+            # outside of testing mode always call into the registry - it skips the rebuild itself if INSTALLED_APPS did not change
             if not settings.TESTING or apps_changed or force_reload:
                 # first startup or force loading of base apps -> registry is prob false
                 if registry.apps_loading or force_reload:
@@ -75,34 +112,11 @@ class AppMixin:
         """
         # unregister models from admin
         for plugin_path in registry.installed_apps:
-            models = []  # the modelrefs need to be collected as popping an item in a iter is not welcomed
-            app_name = plugin_path.split('.')[-1]
             try:
-                app_config = apps.get_app_config(app_name)
-
-                # check all models
-                for model in app_config.get_models():
-                    # remove model from admin site
-                    try:
-                        admin.site.unregister(model)
-                    except Exception:  # pragma: no cover
-                        pass
-                    models += [model._meta.model_name]
-            except LookupError:  # pragma: no cover
-                # if an error occurs the app was never loaded right -> so nothing to do anymore
-                logger.debug(f'{app_name} App was not found during deregistering')
-                break
-
-            # unregister the models (yes, models are just kept in multilevel dicts)
-            for model in models:
-                # remove model from general registry
-                apps.all_models[plugin_path].pop(model)
-
-            # clear the registry for that app
-            # so that the import trick will work on reloading the same plugin
-            # -> the registry is kept for the whole lifecycle
-            if models and app_name in apps.all_models:
-                apps.all_models.pop(app_name)
+                cls._deactivate_app(plugin_path)
+            except Exception as error:  # pragma: no cover
+                # an error in one app must not keep the remaining apps registered
+                logger.error(f'Error while deregistering app `{plugin_path}`: {error}')
 
         # remove plugin from installed_apps
         registry._clean_installed_apps()
@@ -115,12 +129,43 @@ class AppMixin:
         registry._update_urls()
 
     # region helpers
+    @classmethod
+    def _deactivate_app(cls, plugin_path):
+        """Unregister the models of a plugin app from the admin site and the apps registry.
+
+        Args:
+            plugin_path (str): Path of the plugin app
+        """
+        app_name = plugin_path.split('.')[-1]
+        try:
+            app_config = apps.get_app_config(app_name)
+        except LookupError:  # pragma: no cover
+            # if an error occurs the app was never loaded right -> so nothing to do anymore
+            logger.debug(f'{app_name} App was not found during deregistering')
+            return
+
+        models = list(app_config.get_models())
+
+        # remove models from admin site - in one batch
+        registered_models = [model for model in models if model in admin.site._registry]
+        if registered_models:
+            admin.site.unregister(registered_models)
+
+        # clear the registry for that app (yes, models are just kept in multilevel dicts)
+        # so that the import trick will work on reloading the same plugin
+        # -> the registry is kept for the whole lifecycle
+        if models:
+            apps.all_models.pop(app_name, None)
+
     def _reregister_contrib_apps(self, registry):
         """Fix reloading of contrib apps - models and admin.
 
         This is needed if plugins were loaded earlier and then reloaded as models and admins rely on imports.
         Those register models and admin in their respective objects (e.g. admin.site for admin).
         """
+        # models registered with the site admin - checked directly to skip the per-model function calls
+        registered_models = admin.site._registry
+
         for plugin_path in registry.installed_apps:
             try:
                 app_name = plugin_path.split('.')[-1]
@@ -128,7 +173,7 @@ class AppMixin:
             except LookupError:  # pragma: no cover
                 # the plugin was never loaded correctly
                 logger.debug(f'{app_name} App was not found during deregistering')
-                break
+                continue
 
             # reload models if they were set
             # models_module gets set if models were defined - even after multiple loads
@@ -136,11 +181,8 @@ class AppMixin:
             if app_config.models_module and len(app_config.models) == 0:
                 reload(app_config.models_module)
 
-            # check for all models if they are registered with the site admin
-            model_not_reg = False
-            for model in app_config.get_models():
-                if not admin.site.is_registered(model):
-                    model_not_reg = True
+            # check if any model is not registered with the site admin - stops at the first unregistered model
+            model_not_reg = any(model not in registered_models for model in app_config.get_models())
 
             # reload admin if at least one model is not registered
             # models are registered with admin in the 'admin.py' file - so we check
@@ -156,13 +198,7 @@ class AppMixin:
         - a local file / dir
         - a package
         """
-        try:
-            # for local path plugins
-            plugin_path = '.'.join(plugin.path().relative_to(settings.BASE_DIR).parts)
-        except ValueError:  # pragma: no cover
-            # plugin is shipped as package - extract plugin module name
-            plugin_path = plugin.__module__.split('.')[0]
-        return plugin_path
+        return get_plugin_class_path(type(plugin), settings.BASE_DIR)
 
 # endregion
 
@@ -68,7 +68,7 @@ class ScheduleMixin:
 
             for _key, plugin in plugins:
 
-                if plugin.mixin_enabled('schedule'):
+                if plugin.mixin_enabled_cached('schedule'):
 
                     if plugin.is_active():
                         # Only active tasks for plugins which are enabled
@@ -29,7 +29,7 @@ class UrlsMixin:
 
         Args:
             registry (PluginRegistry): The registry that should be used
-            plugins (dict): List of IntegrationPlugins that should be installed
+            plugins (tuple): Key / plugin pairs of IntegrationPlugins that should be installed
             force_reload (bool, optional): Only reload base apps. Defaults to False.
             full_reload (bool, optional): Reload everything - including plugin mechanism. Defaults to False.
         """
@@ -39,7 +39,7 @@ class UrlsMixin:
             urls_changed = False
             # check whether an activated plugin extends UrlsMixin
             for _key, plugin in plugins:
-                if plugin.mixin_enabled('urls'):
+                if plugin.mixin_enabled_cached('urls'):
                     urls_changed = True
             # if apps were changed or force loading base apps -> reload
             if urls_changed or force_reload or full_reload:
@@ -10,6 +10,7 @@ from error_report.models import Error
 
 from InvenTree.unit_test import InvenTreeTestCase
 from plugin import InvenTreePlugin
+from plugin.base.integration.AppMixin import _get_plugin_module_path
 from plugin.base.integration.mixins import PanelMixin
 from plugin.helpers import MixinNotImplementedError
 from plugin.mixins import (APICallMixin, AppMixin, NavigationMixin,
@@ -67,6 +68,21 @@ class SettingsMixinTest(BaseMixinDefinition, InvenTreeTestCase):
         # no setting
         self.assertEqual(self.mixin_nothing.get_setting(''), '')
 
+    def test_activate(self):
+        """Test activation with plugin instances that were not initialised by the registry."""
+        class DummyRegistry:
+            pass
+
+        dummy_registry = DummyRegistry()
+
+        SettingsMixin._activate_mixin(dummy_registry, (('settings', self.mixin), ('nothing', self.mixin_nothing)))
+        self.assertEqual(dummy_registry.mixins_settings, {'settings': self.TEST_SETTINGS})
+
+        # Mixins cached by the registry are used if available
+        self.mixin.enabled_mixins = frozenset()
+        SettingsMixin._activate_mixin(dummy_registry, (('settings', self.mixin), ))
+        self.assertEqual(dummy_registry.mixins_settings, {})
+
 
 class UrlsMixinTest(BaseMixinDefinition, TestCase):
     """Tests for UrlsMixin."""
@@ -128,6 +144,19 @@ class AppMixinTest(BaseMixinDefinition, TestCase):
         """Test that the sample plugin registers in settings."""
         self.assertIn('plugin.samples.integration', settings.INSTALLED_APPS)
 
+    def test_plugin_path_cache(self):
+        """Test that the app path cache does not grow with reloaded plugin classes."""
+        _get_plugin_module_path.cache_clear()
+
+        self.assertEqual(AppMixin._get_plugin_path(self.mixin), 'plugin.base.integration')
+
+        # A reload creates a new class object with the same name
+        class TestCls(AppMixin, InvenTreePlugin):
+            pass
+
+        self.assertEqual(AppMixin._get_plugin_path(TestCls()), 'plugin.base.integration')
+        self.assertEqual(_get_plugin_module_path.cache_info().currsize, 1)
+
 
 class NavigationMixinTest(BaseMixinDefinition, TestCase):
     """Tests for NavigationMixin."""
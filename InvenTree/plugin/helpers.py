@@ -1,5 +1,6 @@
 """Helpers for plugin app."""
 
+import functools
 import inspect
 import logging
 import os
@@ -100,9 +101,19 @@ def handle_error(error, do_raise: bool = True, do_log: bool = True, log_name: st
         raise IntegrationPluginError(package_name, str(error))
 
 
-def get_entrypoints():
-    """Returns list for entrypoints for InvenTree plugins."""
-    return entry_points().get('inventree_plugins', [])
+@functools.lru_cache(maxsize=1)
+def get_entrypoints(group: str = 'inventree_plugins'):
+    """Returns list for entrypoints for InvenTree plugins.
+
+    The result is cached as resolving entrypoints parses the metadata of all installed distributions.
+    Use `get_entrypoints.cache_clear()` to force a rediscovery (e.g. after installing a new package).
+    """
+    try:
+        # Python 3.10+ - the group is selected by the metadata layer
+        return tuple(entry_points(group=group))
+    except TypeError:  # pragma: no cover
+        # Older versions do not support selecting - returns a dict of all groups
+        return tuple(entry_points().get(group, []))
 # endregion
 
 
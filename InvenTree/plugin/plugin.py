@@ -122,6 +122,9 @@ class MetaBase:
 class MixinBase:
     """Base set of mixin functions and mechanisms."""
 
+    # Mixins checked by the registry while (de)activating plugins - their state is cached in `enabled_mixins`
+    CACHED_MIXINS = ('app', 'settings', 'schedule', 'urls')
+
     def __init__(self, *args, **kwargs) -> None:
         """Init sup-parts.
 
@@ -147,6 +150,21 @@ class MixinBase:
             return getattr(self, fnc_name, True)
         return False
 
+    def mixin_enabled_cached(self, key):
+        """Check if mixin is enabled - uses the mixins cached by the registry if they are available."""
+        enabled_mixins = getattr(self, 'enabled_mixins', None)
+        if enabled_mixins is None or key not in self.CACHED_MIXINS:
+            return self.mixin_enabled(key)
+        return key in enabled_mixins
+
+    def get_enabled_mixins(self):
+        """Return the keys of the cached mixins that are registered, enabled and ready.
+
+        Only the mixins in `CACHED_MIXINS` are checked - the readiness checks of other mixins may raise
+        (e.g. `APICallMixin.has_api_call`) and are left to the code that uses them.
+        """
+        return frozenset(key for key in self.CACHED_MIXINS if self.mixin_enabled(key))
+
     def add_mixin(self, key: str, fnc_enabled=True, cls=None):
         """Add a mixin to the plugins registry."""
         self._mixins[key] = fnc_enabled
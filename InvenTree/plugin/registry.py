@@ -11,7 +11,7 @@ import os
 import subprocess
 import time
 from pathlib import Path
-from typing import Any, Dict, List, OrderedDict
+from typing import Any, Dict, List, Set
 
 from django.apps import apps
 from django.conf import settings
@@ -21,8 +21,7 @@ from django.urls import clear_url_caches, include, re_path
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
-from maintenance_mode.core import (get_maintenance_mode, maintenance_mode_on,
-                                   set_maintenance_mode)
+from maintenance_mode.core import get_maintenance_mode, set_maintenance_mode
 
 from InvenTree.config import get_setting
 from InvenTree.ready import canAppAccessDatabase
@@ -65,6 +64,11 @@ class PluginsRegistry:
         self.apps_loading = True                                # Marks if apps were reloaded yet
 
         self.installed_apps = []                                # Holds all added plugin_paths
+        self.installed_apps_state = None                        # INSTALLED_APPS at the last apps reload
+        self.url_indexes = None                                 # Positions of the admin / plugin urls in the frontend patterns
+
+        self.maintenance_depth = 0                              # Nesting depth of maintenance mode requests
+        self.maintenance_owned = False                          # Marks if maintenance mode was switched on by the registry
 
     def get_plugin(self, slug):
         """Lookup plugin by slug (unique key)."""
@@ -118,56 +122,54 @@ class PluginsRegistry:
         logger.info('Loading plugins')
 
         # Set maintanace mode
-        _maintenance = bool(get_maintenance_mode())
-        if not _maintenance:
-            set_maintenance_mode(True)
-
-        registered_successful = False
-        blocked_plugin = None
-        retry_counter = settings.PLUGIN_RETRY
-
-        while not registered_successful:
-            try:
-                # We are using the db so for migrations etc we need to try this block
-                self._init_plugins(blocked_plugin)
-                self._activate_plugins(full_reload=full_reload)
-                registered_successful = True
-            except (OperationalError, ProgrammingError):  # pragma: no cover
-                # Exception if the database has not been migrated yet
-                logger.info('Database not accessible while loading plugins')
-                break
-            except IntegrationPluginError as error:
-                logger.error(f'[PLUGIN] Encountered an error with {error.path}:\n{error.message}')
-                log_error({error.path: error.message}, 'load')
-                blocked_plugin = error.path  # we will not try to load this app again
-
-                # Initialize apps without any plugins
-                self._clean_registry()
-                self._clean_installed_apps()
-                self._activate_plugins(force_reload=True, full_reload=full_reload)
-
-                # We do not want to end in an endless loop
-                retry_counter -= 1
-
-                if retry_counter <= 0:  # pragma: no cover
-                    if settings.PLUGIN_TESTING:
-                        print('[PLUGIN] Max retries, breaking loading')
-                    break
-                if settings.PLUGIN_TESTING:
-                    print(f'[PLUGIN] Above error occurred during testing - {retry_counter}/{settings.PLUGIN_RETRY} retries left')
+        self._acquire_maintenance()
 
-                # now the loading will re-start up with init
+        try:
+            registered_successful = False
+            blocked_plugins = set()
+            retry_counter = settings.PLUGIN_RETRY
+
+            while not registered_successful:
+                try:
+                    # We are using the db so for migrations etc we need to try this block
+                    self._init_plugins(blocked_plugins)
+                    self._activate_plugins(full_reload=full_reload)
+                    registered_successful = True
+                except (OperationalError, ProgrammingError):  # pragma: no cover
+                    # Exception if the database has not been migrated yet
+                    logger.info('Database not accessible while loading plugins')
+                    break
+                except IntegrationPluginError as error:
+                    logger.error(f'[PLUGIN] Encountered an error with {error.path}:\n{error.message}')
+                    log_error({error.path: error.message}, 'load')
+                    blocked_plugins.add(error.path)  # we will not try to load these apps again
+
+                    # Initialize apps without any plugins
+                    self._clean_registry()
+                    self._clean_installed_apps()
+                    self._activate_plugins(force_reload=True, full_reload=full_reload)
+
+                    # We do not want to end in an endless loop
+                    retry_counter -= 1
+
+                    if retry_counter <= 0:  # pragma: no cover
+                        if settings.PLUGIN_TESTING:
+                            print('[PLUGIN] Max retries, breaking loading')
+                        break
+                    if settings.PLUGIN_TESTING:
+                        print(f'[PLUGIN] Above error occurred during testing - {retry_counter}/{settings.PLUGIN_RETRY} retries left')
 
-            # disable full reload after the first round
-            if full_reload:
-                full_reload = False
+                    # now the loading will re-start up with init
 
-        # ensure plugins_loaded is True
-        self.plugins_loaded = True
+                # disable full reload after the first round
+                if full_reload:
+                    full_reload = False
 
-        # Remove maintenance mode
-        if not _maintenance:
-            set_maintenance_mode(False)
+            # ensure plugins_loaded is True
+            self.plugins_loaded = True
+        finally:
+            # Remove maintenance mode
+            self._release_maintenance()
 
         logger.debug('Finished loading plugins')
 
@@ -186,19 +188,17 @@ class PluginsRegistry:
         logger.info('Start unloading plugins')
 
         # Set maintanace mode
-        _maintenance = bool(get_maintenance_mode())
-        if not _maintenance:
-            set_maintenance_mode(True)  # pragma: no cover
-
-        # remove all plugins from registry
-        self._clean_registry()
+        self._acquire_maintenance()
 
-        # deactivate all integrations
-        self._deactivate_plugins(force_reload=force_reload)
+        try:
+            # remove all plugins from registry
+            self._clean_registry()
 
-        # remove maintenance
-        if not _maintenance:
-            set_maintenance_mode(False)  # pragma: no cover
+            # deactivate all integrations
+            self._deactivate_plugins(force_reload=force_reload)
+        finally:
+            # remove maintenance
+            self._release_maintenance()
 
         logger.info('Finished unloading plugins')
 
@@ -215,14 +215,40 @@ class PluginsRegistry:
 
         logger.info('Start reloading plugins')
 
-        with maintenance_mode_on():
+        # Set maintanace mode - nested (un)loading calls do not toggle it again
+        self._acquire_maintenance()
+
+        try:
             self.plugins_loaded = False
             self.unload_plugins(force_reload=force_reload)
             self.plugins_loaded = True
             self.load_plugins(full_reload=full_reload)
+        finally:
+            self._release_maintenance()
 
         logger.info('Finished reloading plugins')
 
+    def _acquire_maintenance(self):
+        """Enter maintenance mode for (un)loading plugins.
+
+        Calls can be nested - only the outermost call writes to the maintenance mode backend.
+        Maintenance mode that was already set from outside the registry is left untouched.
+        """
+        if self.maintenance_depth == 0:
+            self.maintenance_owned = not get_maintenance_mode()
+            if self.maintenance_owned:
+                set_maintenance_mode(True)
+
+        self.maintenance_depth += 1
+
+    def _release_maintenance(self):
+        """Leave maintenance mode - switched off once the outermost caller is done."""
+        self.maintenance_depth = max(self.maintenance_depth - 1, 0)
+
+        if self.maintenance_depth == 0 and self.maintenance_owned:
+            self.maintenance_owned = False
+            set_maintenance_mode(False)
+
     def plugin_dirs(self):
         """Construct a list of directories from where plugins can be loaded"""
 
@@ -289,7 +315,7 @@ class PluginsRegistry:
         # Collect plugins from paths
         for plugin in self.plugin_dirs():
 
-            logger.debug(f"Loading plugins from directory '{plugin}'")
+            logger.debug("Loading plugins from directory '%s'", plugin)
 
             parent_path = None
             parent_obj = Path(plugin)
@@ -308,7 +334,7 @@ class PluginsRegistry:
             modules = get_plugins(raw_module, InvenTreePlugin, path=parent_path)
 
             if modules:
-                [collected_plugins.append(item) for item in modules]
+                collected_plugins.extend(modules)
 
         # From this point any plugins are considered "external" and only loaded if plugins are explicitly enabled
         if settings.PLUGINS_ENABLED:
@@ -325,12 +351,27 @@ class PluginsRegistry:
                     except Exception as error:  # pragma: no cover
                         handle_error(error, do_raise=False, log_name='discovery')
 
+        # Remove duplicates - a plugin can be discovered more than once (e.g. if it is imported by another module)
+        unique_plugins = {}
+        for plugin in collected_plugins:
+            plugin_ref = f'{plugin.__module__}.{plugin.__qualname__}'
+            if plugin_ref in unique_plugins:
+                logger.warning(f"Plugin '{plugin_ref}' was discovered more than once - skipping duplicate")
+                continue
+            unique_plugins[plugin_ref] = plugin
+        collected_plugins = list(unique_plugins.values())
+
         # Log collected plugins
         logger.info(f'Collected {len(collected_plugins)} plugins')
-        logger.debug(", ".join([a.__module__ for a in collected_plugins]))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(", ".join(a.__module__ for a in collected_plugins))
 
         return collected_plugins
 
+    def invalidate_plugin_cache(self):
+        """Clear cached discovery results so that the next collection rescans installed packages."""
+        get_entrypoints.cache_clear()
+
     def discover_mixins(self):
         """Discover all mixins from plugins and register them."""
         collected_mixins = {}
@@ -355,6 +396,9 @@ class PluginsRegistry:
             # System most likely does not have 'git' installed
             return False
 
+        # new packages might have been installed
+        self.invalidate_plugin_cache()
+
         # do not run again
         settings.PLUGIN_FILE_CHECKED = True
         return 'first_run'
@@ -386,11 +430,11 @@ class PluginsRegistry:
     # endregion
 
     # region general internal loading /activating / deactivating / deloading
-    def _init_plugins(self, disabled: str = None):
+    def _init_plugins(self, disabled: Set[str] = None):
         """Initialise all found plugins.
 
         Args:
-            disabled (str, optional): Loading path of disabled app. Defaults to None.
+            disabled (set, optional): Loading paths of disabled apps. Defaults to None.
 
         Raises:
             error: IntegrationPluginError
@@ -413,22 +457,30 @@ class PluginsRegistry:
 
         logger.debug('Starting plugin initialisation')
 
+        # Fetch the configs for all plugins at once - missing ones are created in bulk
+        try:
+            plugin_configs = self._get_plugin_configs()
+        except (OperationalError, ProgrammingError) as error:
+            # Exception if the database has not been migrated yet - check if test are running - raise if not
+            if not settings.PLUGIN_TESTING:
+                raise error  # pragma: no cover
+            plugin_configs = None
+
         # Initialize plugins
         for plg in self.plugin_modules:
             # These checks only use attributes - never use plugin supplied functions -> that would lead to arbitrary code execution!!
             plg_name = plg.NAME
-            plg_key = slugify(plg.SLUG if getattr(plg, 'SLUG', None) else plg_name)  # keys are slugs!
-
-            try:
-                plg_db, _created = PluginConfig.objects.get_or_create(key=plg_key, name=plg_name)
-            except (OperationalError, ProgrammingError) as error:
-                # Exception if the database has not been migrated yet - check if test are running - raise if not
-                if not settings.PLUGIN_TESTING:
-                    raise error  # pragma: no cover
-                plg_db = None
-            except (IntegrityError) as error:  # pragma: no cover
-                logger.error(f"Error initializing plugin `{plg_name}`: {error}")
-                handle_error(error, log_name='init')
+            plg_key = self._get_plugin_key(plg)
+
+            plg_db = plugin_configs.get(plg_key) if plugin_configs is not None else None
+
+            if plugin_configs is not None and (plg_db is None or plg_db.name != plg_name):  # pragma: no cover
+                # The stored config does not match this plugin - look it up individually so conflicts are reported
+                try:
+                    plg_db, _created = PluginConfig.objects.get_or_create(key=plg_key, name=plg_name)
+                except (IntegrityError) as error:
+                    logger.error(f"Error initializing plugin `{plg_name}`: {error}")
+                    handle_error(error, log_name='init')
 
             # Append reference to plugin
             plg.db = plg_db
@@ -447,18 +499,18 @@ class PluginsRegistry:
             # - If this plugin has been explicitly enabled by the user
             if settings.PLUGIN_TESTING or builtin or (plg_db and plg_db.active):
                 # Check if the plugin was blocked -> threw an error; option1: package, option2: file-based
-                if disabled and ((plg.__name__ == disabled) or (plg.__module__ == disabled)):
+                if disabled and ((plg.__name__ in disabled) or (plg.__module__ in disabled)):
                     safe_reference(plugin=plg, key=plg_key, active=False)
                     continue  # continue -> the plugin is not loaded
 
                 # Initialize package - we can be sure that an admin has activated the plugin
-                logger.debug(f'Loading plugin `{plg_name}`')
+                logger.debug('Loading plugin `%s`', plg_name)
 
                 try:
                     t_start = time.time()
                     plg_i: InvenTreePlugin = plg()
                     dt = time.time() - t_start
-                    logger.info(f'Loaded plugin `{plg_name}` in {dt:.3f}s')
+                    logger.info('Loaded plugin `%s` in %.3fs', plg_name, dt)
                 except Exception as error:
                     handle_error(error, log_name='init')  # log error and raise it -> disable plugin
                     logger.warning(f"Plugin `{plg_name}` could not be loaded")
@@ -468,6 +520,9 @@ class PluginsRegistry:
                 plg_i.pk = plg_db.pk if plg_db else None
                 plg_i.db = plg_db
 
+                # Cache enabled mixins - they are checked repeatedly while activating
+                plg_i.enabled_mixins = plg_i.get_enabled_mixins()
+
                 # Run version check for plugin
                 if (plg_i.MIN_VERSION or plg_i.MAX_VERSION) and not plg_i.check_version():
                     # Disable plugin
@@ -487,6 +542,33 @@ class PluginsRegistry:
             else:  # pragma: no cover
                 safe_reference(plugin=plg, key=plg_key, active=False)
 
+    def _get_plugin_key(self, plugin):
+        """Return the unique key for a plugin class - keys are slugs!"""
+        return slugify(plugin.SLUG if getattr(plugin, 'SLUG', None) else plugin.NAME)
+
+    def _get_plugin_configs(self):
+        """Return a dict of PluginConfig entries for all discovered plugins, keyed by plugin key.
+
+        Existing entries are fetched with a single query, missing entries are created in bulk.
+        """
+        from plugin.models import PluginConfig
+
+        plugin_names = {}
+        for plg in self.plugin_modules:
+            plugin_names.setdefault(self._get_plugin_key(plg), plg.NAME)
+
+        configs = {cfg.key: cfg for cfg in PluginConfig.objects.filter(key__in=plugin_names.keys())}
+
+        missing = [PluginConfig(key=key, name=name) for key, name in plugin_names.items() if key not in configs]
+
+        if missing:
+            PluginConfig.objects.bulk_create(missing, ignore_conflicts=True)
+
+            # Re-query to get primary keys (and entries created concurrently)
+            configs.update({cfg.key: cfg for cfg in PluginConfig.objects.filter(key__in=[cfg.key for cfg in missing])})
+
+        return configs
+
     def __get_mixin_order(self):
         """Returns a list of mixin classes, in the order that they should be activated."""
         # Preset list of mixins
@@ -509,7 +591,7 @@ class PluginsRegistry:
         self.discover_mixins()
 
         # Activate integrations
-        plugins = self.plugins.items()
+        plugins = tuple(self.plugins.items())
         logger.info(f'Found {len(plugins)} active plugins')
 
         for mixin in self.__get_mixin_order():
@@ -550,12 +632,19 @@ class PluginsRegistry:
             force_reload (bool, optional): Also reload base apps. Defaults to False.
             full_reload (bool, optional): Reload everything - including plugin mechanism. Defaults to False.
         """
+        installed_apps_state = tuple(settings.INSTALLED_APPS)
+
+        # Rebuilding the app registry is expensive - skip it if nothing changed
+        if not (force_reload or full_reload) and installed_apps_state == self.installed_apps_state:
+            logger.debug('INSTALLED_APPS unchanged - skipping apps reload')
+            return
+
         # If full_reloading is set to true we do not want to set the flag
         if not full_reload:
             self.is_loading = True  # set flag to disable loop reloading
         if force_reload:
             # we can not use the built in functions as we need to brute force the registry
-            apps.app_configs = OrderedDict()
+            apps.app_configs = {}
             apps.apps_ready = apps.models_ready = apps.loading = apps.ready = False
             apps.clear_cache()
             self._try_reload(apps.populate, settings.INSTALLED_APPS)
@@ -563,10 +652,11 @@ class PluginsRegistry:
             self._try_reload(apps.set_installed_apps, settings.INSTALLED_APPS)
         self.is_loading = False
 
+        self.installed_apps_state = installed_apps_state
+
     def _clean_installed_apps(self):
-        for plugin in self.installed_apps:
-            if plugin in settings.INSTALLED_APPS:
-                settings.INSTALLED_APPS.remove(plugin)
+        plugin_apps = set(self.installed_apps)
+        settings.INSTALLED_APPS = [app for app in settings.INSTALLED_APPS if app not in plugin_apps]
 
         self.installed_apps = []
 
@@ -581,12 +671,17 @@ class PluginsRegistry:
         from InvenTree.urls import urlpatterns as global_pattern
         from plugin.urls import get_plugin_urls
 
-        for index, url in enumerate(urlpattern):
-            if hasattr(url, 'app_name'):
-                if url.app_name == 'admin':
-                    urlpattern[index] = re_path(r'^admin/', admin.site.urls, name='inventree-admin')
-                elif url.app_name == 'plugin':
-                    urlpattern[index] = get_plugin_urls()
+        # The entries are only ever replaced in place - so their positions are looked up once
+        if self.url_indexes is None:
+            self.url_indexes = [
+                (index, url.app_name) for index, url in enumerate(urlpattern) if getattr(url, 'app_name', None) in ('admin', 'plugin')
+            ]
+
+        for index, app_name in self.url_indexes:
+            if app_name == 'admin':
+                urlpattern[index] = re_path(r'^admin/', admin.site.urls, name='inventree-admin')
+            else:
+                urlpattern[index] = get_plugin_urls()
 
         # Replace frontendpatterns
         global_pattern[0] = re_path('', include(urlpattern))
@@ -163,6 +163,10 @@ class PluginConfigInstallSerializer(serializers.Serializer):
 
         # save plugin to plugin_file if installed successful
         if success:
+            # make sure the new package is discovered
+            from plugin import registry
+            registry.invalidate_plugin_cache()
+
             # Read content of plugin file
             plg_lines = open(settings.PLUGIN_FILE).readlines()
             with open(settings.PLUGIN_FILE, "a") as plugin_file:
@@ -2,7 +2,7 @@
 
 from django.test import TestCase
 
-from .helpers import render_template
+from .helpers import get_entrypoints, render_template
 
 
 class HelperTests(TestCase):
@@ -21,3 +21,17 @@ class HelperTests(TestCase):
         response = render_template(ErrorSource(), 'sample/wrongsample.html', {'abc': 123})
         self.assertTrue('lert alert-block alert-danger' in response)
         self.assertTrue('Template file <em>sample/wrongsample.html</em>' in response)
+
+    def test_get_entrypoints(self):
+        """Check that entrypoint lookups are cached until invalidated."""
+        get_entrypoints.cache_clear()
+
+        entrypoints = get_entrypoints()
+        self.assertIsInstance(entrypoints, tuple)
+        self.assertIs(get_entrypoints(), entrypoints)
+        self.assertEqual(get_entrypoints.cache_info().hits, 1)
+
+        # Clearing the cache forces a rescan
+        get_entrypoints.cache_clear()
+        get_entrypoints()
+        self.assertEqual(get_entrypoints.cache_info().misses, 1)
@@ -12,6 +12,7 @@ from django.test import TestCase, override_settings
 
 import plugin.templatetags.plugin_extras as plugin_tags
 from plugin import InvenTreePlugin, registry
+from plugin.helpers import IntegrationPluginError, MixinNotImplementedError
 from plugin.samples.integration.another_sample import (NoIntegrationPlugin,
                                                        WrongIntegrationPlugin)
 from plugin.samples.integration.sample import SampleIntegrationPlugin
@@ -250,6 +251,7 @@ class RegistryTests(TestCase):
         """Test that package distributed plugins work."""
         # Install sample package
         subprocess.check_output('pip install inventree-zapier'.split())
+        registry.invalidate_plugin_cache()
 
         # Reload to discover plugin
         registry.reload_plugins(full_reload=True)
@@ -258,3 +260,145 @@ class RegistryTests(TestCase):
         plg = registry.get_plugin('zapier')
         self.assertEqual(plg.slug, 'zapier')
         self.assertEqual(plg.name, 'inventree_zapier')
+
+    @override_settings(PLUGIN_TESTING_SETUP=True, PLUGINS_ENABLED=True)
+    def test_entrypoint_cache(self):
+        """Test that entrypoints are only scanned again after the cache was invalidated."""
+        registry.invalidate_plugin_cache()
+
+        with mock.patch('plugin.helpers.entry_points', return_value=[]) as entry_points:
+            registry.collect_plugins()
+            self.assertEqual(entry_points.call_count, 1)
+
+            # Collecting again (as every reload does) does not rescan installed packages
+            registry.collect_plugins()
+            registry.collect_plugins()
+            self.assertEqual(entry_points.call_count, 1)
+
+            # Invalidating the cache (e.g. after installing a package) does
+            registry.invalidate_plugin_cache()
+            registry.collect_plugins()
+            self.assertEqual(entry_points.call_count, 2)
+
+        registry.invalidate_plugin_cache()
+
+    def test_plugin_configs_bulk(self):
+        """Test that missing PluginConfig entries are created in one batch."""
+        from plugin.models import PluginConfig
+
+        PluginConfig.objects.all().delete()
+
+        with mock.patch.object(PluginConfig.objects, 'bulk_create', wraps=PluginConfig.objects.bulk_create) as bulk_create:
+            configs = registry._get_plugin_configs()
+
+        bulk_create.assert_called_once()
+
+        # All plugins have a stored config now
+        keys = {registry._get_plugin_key(plg) for plg in registry.plugin_modules}
+        self.assertEqual(set(configs.keys()), keys)
+        self.assertEqual(PluginConfig.objects.filter(key__in=keys).count(), len(keys))
+        self.assertTrue(all(cfg.pk for cfg in configs.values()))
+
+        # Nothing is created if all configs exist
+        with mock.patch.object(PluginConfig.objects, 'bulk_create') as bulk_create:
+            registry._get_plugin_configs()
+
+        bulk_create.assert_not_called()
+
+    def test_blocked_plugins(self):
+        """Test that all failing plugins stay blocked while retrying to load."""
+        disabled_calls = []
+
+        def init_plugins(disabled=None):
+            """Fail for every broken plugin that is not blocked yet."""
+            disabled_calls.append(set(disabled))
+            for path in ['broken_a', 'broken_b']:
+                if path not in disabled:
+                    raise IntegrationPluginError(path, 'broken')
+
+        with mock.patch.object(registry, '_init_plugins', side_effect=init_plugins), \
+                mock.patch.object(registry, '_activate_plugins'), \
+                mock.patch.object(registry, '_clean_registry'), \
+                mock.patch.object(registry, '_clean_installed_apps'):
+            registry.load_plugins()
+
+        self.assertEqual(disabled_calls, [set(), {'broken_a'}, {'broken_a', 'broken_b'}])
+
+    def test_urls_updated_on_unload(self):
+        """Test that urls are updated on every unload - even if INSTALLED_APPS did not change."""
+        from InvenTree.urls import frontendpatterns
+
+        try:
+            with mock.patch.object(registry, '_update_urls', wraps=registry._update_urls) as update_urls:
+                registry.unload_plugins()
+                registry.unload_plugins()
+
+            self.assertEqual(update_urls.call_count, 2)
+
+            # No plugin urls are mounted anymore
+            for url in frontendpatterns:
+                if getattr(url, 'app_name', None) == 'plugin':
+                    self.assertEqual(url.url_patterns, [])
+        finally:
+            registry.load_plugins()
+
+    def test_maintenance_nesting(self):
+        """Test that nested maintenance mode requests only write to the backend once."""
+        with mock.patch('plugin.registry.get_maintenance_mode', return_value=False) as get_mode, \
+                mock.patch('plugin.registry.set_maintenance_mode') as set_mode:
+            registry._acquire_maintenance()
+            registry._acquire_maintenance()
+            registry._release_maintenance()
+
+            # Still in maintenance - nothing released yet
+            set_mode.assert_called_once_with(True)
+
+            registry._release_maintenance()
+
+            self.assertEqual(set_mode.call_args_list, [mock.call(True), mock.call(False)])
+            get_mode.assert_called_once()
+
+        # Maintenance mode set from outside is left alone
+        with mock.patch('plugin.registry.get_maintenance_mode', return_value=True), \
+                mock.patch('plugin.registry.set_maintenance_mode') as set_mode:
+            registry._acquire_maintenance()
+            registry._acquire_maintenance()
+            registry._release_maintenance()
+            registry._release_maintenance()
+
+            set_mode.assert_not_called()
+
+        self.assertEqual(registry.maintenance_depth, 0)
+
+    def test_duplicate_plugins(self):
+        """Test that plugins discovered more than once are only collected once."""
+        discovered = [SampleIntegrationPlugin, NoIntegrationPlugin, SampleIntegrationPlugin]
+
+        with mock.patch('plugin.registry.get_plugins', return_value=discovered):
+            with self.assertLogs(logger='inventree', level='WARNING') as cm:
+                collected = registry.collect_plugins()
+
+        self.assertEqual(collected, [SampleIntegrationPlugin, NoIntegrationPlugin])
+        self.assertIn('was discovered more than once', str(cm[1]))
+
+    def test_misconfigured_mixin(self):
+        """Test that a plugin with a failing mixin check can still be initialised."""
+        from plugin.mixins import APICallMixin
+
+        class MisconfiguredPlugin(APICallMixin, InvenTreePlugin):
+            """APICallMixin without API_URL_SETTING / API_TOKEN_SETTING."""
+
+            NAME = 'MisconfiguredAPICall'
+
+        # The mixin check itself raises
+        with self.assertRaises(MixinNotImplementedError):
+            MisconfiguredPlugin().has_api_call
+
+        self.assertEqual(MisconfiguredPlugin().get_enabled_mixins(), frozenset())
+
+        with mock.patch.multiple(registry, plugin_modules=[MisconfiguredPlugin], plugins={}, plugins_inactive={}, plugins_full={}):
+            registry._init_plugins()
+
+            plg = registry.plugins['misconfiguredapicall']
+            self.assertEqual(plg.enabled_mixins, frozenset())
+            self.assertFalse(plg.mixin_enabled_cached('app'))